@@ -638,38 +638,55 @@ def detect_anomalies(df: pd.DataFrame) -> Dict[str, Any]:
         'network_total_bytes_sum': 'Network Traffic'
     }
     
-    # Detect anomalies per instance
-    for instance_id in df['instance_id'].unique():
-        instance_df = df[df['instance_id'] == instance_id]
-        instance_key = str(instance_id)
+    present = [m for m in metrics_to_check if m in df.columns]
+    if not present:
+        return anomalies
+    
+    # Q1/Q3 for every (instance, metric) in one grouped call (NaNs are skipped per column)
+    codes, instances = pd.factorize(df['instance_id'])
+    if len(instances) == 0:
+        return anomalies
+    grouped = df.groupby('instance_id', sort=False)[present]
+    q = grouped.quantile([0.25, 0.75])
+    q1 = q.xs(0.25, level=-1).reindex(instances).to_numpy(dtype=float)
+    q3 = q.xs(0.75, level=-1).reindex(instances).to_numpy(dtype=float)
+    counts = grouped.count().reindex(instances).to_numpy()  # Need at least 4 data points for IQR
+    iqr = q3 - q1
+    
+    # Define outlier boundaries (one row per instance)
+    lower_bounds = q1 - 1.5 * iqr
+    upper_bounds = q3 + 1.5 * iqr
+    
+    # Global outlier mask: broadcast each row against its instance's bounds
+    vals = df[present].to_numpy(dtype=float)
+    mask = (vals < lower_bounds[codes]) | (vals > upper_bounds[codes])
+    mask &= (codes >= 0)[:, None] & (counts[codes] > 3)
+    dates = df['date'].to_numpy(dtype=object)
+    
+    # Split results per instance only when building the output dict
+    # (one stable argsort groups row positions by instance, keeping original row order)
+    order = np.argsort(codes, kind='stable')
+    order = order[codes[order] >= 0]
+    row_groups = np.split(order, np.cumsum(np.bincount(codes[order], minlength=len(instances)))[:-1])
+    
+    for k, instance_id in enumerate(instances):
+        rows = row_groups[k]
+        instance_mask = mask[rows]
         instance_anomalies = {}
         
-        for metric, label in metrics_to_check.items():
-            if metric in instance_df.columns:
-                metric_data = instance_df[metric].dropna()
-                
-                if len(metric_data) > 3:  # Need at least 4 data points for IQR
-                    Q1 = metric_data.quantile(0.25)
-                    Q3 = metric_data.quantile(0.75)
-                    IQR = Q3 - Q1
-                    
-                    # Define outlier boundaries
-                    lower_bound = Q1 - 1.5 * IQR
-                    upper_bound = Q3 + 1.5 * IQR
-                    
-                    # Find anomalies
-                    anomaly_df = instance_df[(instance_df[metric] < lower_bound) | (instance_df[metric] > upper_bound)].copy()
-                    
-                    if len(anomaly_df) > 0:
-                        instance_anomalies[label] = {
-                            'count': int(len(anomaly_df)),
-                            'dates': [str(date) for date in anomaly_df['date'].tolist()],
-                            'values': [float(v) for v in anomaly_df[metric].tolist()],
-                            'lower_bound': float(lower_bound),
-                            'upper_bound': float(upper_bound)
-                        }
+        for i, metric in enumerate(present):
+            col_mask = instance_mask[:, i]
+            if col_mask.any():
+                anomaly_rows = rows[col_mask]
+                instance_anomalies[metrics_to_check[metric]] = {
+                    'count': int(col_mask.sum()),
+                    'dates': [str(date) for date in dates[anomaly_rows]],
+                    'values': [float(v) for v in vals[anomaly_rows, i]],
+                    'lower_bound': float(lower_bounds[k, i]),
+                    'upper_bound': float(upper_bounds[k, i])
+                }
         
         if instance_anomalies:
-            anomalies[instance_key] = instance_anomalies
+            anomalies[str(instance_id)] = instance_anomalies
     
     return anomalies
\ No newline at end of file
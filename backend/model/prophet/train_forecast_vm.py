@@ -5,10 +5,19 @@ from prophet_classifier import ProphetClassifier
 from random_search_tuner import RandomSearchTuner
 from piecewise_loss import PiecewiseLoss
 
+def load_split(path_without_ext: str, split_format: str = 'parquet') -> pd.DataFrame:
+    """Load a train/test split saved by train_test_split_vm_data in the given format"""
+    if split_format == 'parquet':
+        return pd.read_parquet(f'{path_without_ext}.parquet')
+    elif split_format == 'csv':
+        return pd.read_csv(f'{path_without_ext}.csv')
+    raise ValueError(f"Unsupported split_format: {split_format}")
+
 def train_and_forecast_vm_metrics(
     metric_column: str = 'cost_usd_sum',
     forecast_days: int = 14,
-    tune_hyperparameters: bool = True
+    tune_hyperparameters: bool = True,
+    split_format: str = 'parquet'
 ):
     """
     Train Prophet model with hyperparameter tuning and forecast VM metrics.
@@ -17,15 +26,14 @@ def train_and_forecast_vm_metrics(
         metric_column: Which metric to forecast
         forecast_days: Number of days to forecast ahead
         tune_hyperparameters: Whether to tune hyperparameters or use defaults
+        split_format: Format the train/test splits were saved in ('parquet' or 'csv'),
+                      matching output_format of train_test_split_vm_data
     """
     
     # Load train and test data
     data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
-    train_path = os.path.join(data_dir, 'train', 'train_vm_data.csv')
-    test_path = os.path.join(data_dir, 'test', 'test_vm_data.csv')
-    
-    train_df = pd.read_csv(train_path)
-    test_df = pd.read_csv(test_path)
+    train_df = load_split(os.path.join(data_dir, 'train', 'train_vm_data'), split_format)
+    test_df = load_split(os.path.join(data_dir, 'test', 'test_vm_data'), split_format)
     
     # Prepare data for Prophet (requires 'ds' and 'y' columns)
     train_prophet = pd.DataFrame({
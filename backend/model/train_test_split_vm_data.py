@@ -1,8 +1,12 @@
 # backend/model/train_test_split_vm_data.py
-import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 import os
+from backend.preprocessing import FLOAT32_COLUMN_PREFIXES
 
-def train_test_split_vm_data(test_size: float = 0.2, split_by: str = 'time'):
+def train_test_split_vm_data(test_size: float = 0.2, split_by: str = 'time', output_format: str = 'parquet'):
     """
     Split processed VM data into train and test sets
     
@@ -10,39 +14,62 @@ def train_test_split_vm_data(test_size: float = 0.2, split_by: str = 'time'):
         test_size: Proportion of data for testing (default: 0.2 = 20%)
         split_by: 'time' for chronological split (recommended for time-series)
                   'random' for random split (not recommended for temporal data)
+        output_format: 'parquet' (default, zstd-compressed) or 'csv' for the saved splits
     
     Returns:
         train_df, test_df
     """
-    # Load processed data
+    if output_format not in ('parquet', 'csv'):
+        raise ValueError(f"Unsupported output_format: {output_format}")
+    
+    # Load processed data (dates are parsed by the Arrow CSV reader)
     processed_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'processed', 'processed_vm_data.csv')
-    df = pd.read_csv(processed_path)
+    table = pacsv.read_csv(
+        processed_path,
+        convert_options=pacsv.ConvertOptions(column_types={'date': pa.date32()})
+    )
+    # Preprocessing writes the ratio metrics as float32; keep them narrow on reload
+    table = table.cast(pa.schema([
+        field.with_type(pa.float32()) if field.name.startswith(FLOAT32_COLUMN_PREFIXES) else field
+        for field in table.schema
+    ]))
     
-    # Convert date back to datetime for proper sorting
-    df['date'] = pd.to_datetime(df['date'])
-    df = df.sort_values('date')
+    # Sort chronologically; preprocessing already writes rows in date order,
+    # so an O(n) check lets us skip the O(n log n) sort in the common case
+    dates = table.column('date').to_numpy()
+    if not np.all(dates[1:] >= dates[:-1]):
+        table = table.sort_by('date')
+    n = table.num_rows
     
     if split_by == 'time':
         # Time-based split (chronological)
-        split_idx = int(len(df) * (1 - test_size))
-        train_df = df.iloc[:split_idx]
-        test_df = df.iloc[split_idx:]
+        split_idx = int(n * (1 - test_size))
+        train_table = table.slice(0, split_idx)
+        test_table = table.slice(split_idx)
+        train_df, test_df = _to_pandas(train_table), _to_pandas(test_table)
         print(f"Time-based split:")
         print(f"  Training: {train_df['date'].min()} to {train_df['date'].max()}")
         print(f"  Testing:  {test_df['date'].min()} to {test_df['date'].max()}")
     else:
         # Random split (not recommended for time-series)
-        train_df = df.sample(frac=(1-test_size), random_state=42)
-        test_df = df[~df.index.isin(train_df.index)]
+        idx = np.random.default_rng(42).permutation(n)
+        split_idx = int(round(n * (1 - test_size)))
+        train_table = table.take(idx[:split_idx])
+        test_table = table.take(np.sort(idx[split_idx:]))
+        train_df, test_df = _to_pandas(train_table), _to_pandas(test_table)
         print(f"Random split: {len(train_df)} train, {len(test_df)} test")
     
     # Save splits
     output_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
-    train_path = os.path.join(output_dir, 'train', 'train_vm_data.csv')
-    test_path = os.path.join(output_dir, 'test', 'test_vm_data.csv')
+    train_path = os.path.join(output_dir, 'train', f'train_vm_data.{output_format}')
+    test_path = os.path.join(output_dir, 'test', f'test_vm_data.{output_format}')
     
-    train_df.to_csv(train_path, index=False)
-    test_df.to_csv(test_path, index=False)
+    if output_format == 'parquet':
+        pq.write_table(train_table, train_path, compression='zstd')
+        pq.write_table(test_table, test_path, compression='zstd')
+    else:
+        pacsv.write_csv(train_table, train_path)
+        pacsv.write_csv(test_table, test_path)
     
     print(f"\nSaved:")
     print(f"  Train: {train_path}")
@@ -50,5 +77,11 @@ def train_test_split_vm_data(test_size: float = 0.2, split_by: str = 'time'):
     
     return train_df, test_df
 
+def _to_pandas(table: pa.Table):
+    """Convert an Arrow table to pandas with 'date' as datetime64[ns], as pd.to_datetime gives"""
+    df = table.to_pandas(date_as_object=False)
+    df['date'] = df['date'].astype('datetime64[ns]')
+    return df
+
 if __name__ == "__main__":
-    train_test_split_vm_data()
\ No newline at end of file
+    train_test_split_vm_data()
@@ -1,4 +1,4 @@
 # backend/preprocessing/__init__.py
-from .preprocessing_vm_data import preprocess_vm_data, categorize_sku
+from .preprocessing_vm_data import preprocess_vm_data, categorize_sku, FLOAT32_COLUMN_PREFIXES
 
-__all__ = ['preprocess_vm_data', 'categorize_sku']
\ No newline at end of file
+__all__ = ['preprocess_vm_data', 'categorize_sku', 'FLOAT32_COLUMN_PREFIXES']
\ No newline at end of file
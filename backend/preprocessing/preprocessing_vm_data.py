@@ -1,9 +1,41 @@
 # backend/preprocessing/preprocessing_vm_data.py
 import pandas as pd
+import numpy as np
+import polars as pl
 import warnings
 import os
+import re
 warnings.filterwarnings('ignore')
 
+# //compute.googleapis.com/projects/<project>/zones/<zone>/instances/<id>
+RESOURCE_NAME_PATTERN = re.compile(r'/projects/([^/]+)/(?:.*?/)?zones/([^/]+)/(?:.*?/)?instances/(\d+)')
+RESOURCE_NAME_FIELDS = ['project_id', 'zone', 'instance_id']
+# Per-field fallbacks for names that don't fit the full layout (e.g. .../zones/<zone>/disks/<disk>)
+RESOURCE_FIELD_PATTERNS = [
+    re.compile(r'/projects/([^/]+)/'),
+    re.compile(r'/zones/([^/]+)/'),
+    re.compile(r'/instances/(\d+)'),
+]
+
+# Daily aggregation spec: column -> list of aggregations
+GROUP_KEYS = ['date', 'instance_id', 'project_id', 'zone']
+AGG_SPEC = {
+    'cpu_utilization': ['mean', 'std', 'min', 'max'],
+    'memory_used_gb': ['mean', 'std', 'min', 'max'],
+    'disk_read_bytes': ['sum', 'mean'],
+    'disk_write_bytes': ['sum', 'mean'],
+    'ingress_bytes': ['sum', 'mean'],
+    'egress_bytes': ['sum', 'mean'],
+    'network_total_bytes': ['sum', 'mean'],
+    'disk_total_bytes': ['sum', 'mean'],
+    'uptime_fraction': ['mean', 'min', 'max'],
+    'cost_usd': ['sum', 'mean', 'max'],
+    'cost_per_cpu': ['mean'],
+}
+
+# Bounded ratio metrics (0..1) that are stored as float32 in the processed CSV
+FLOAT32_COLUMN_PREFIXES = ('cpu_utilization_', 'uptime_fraction_')
+
 def preprocess_vm_data(df: pd.DataFrame, save_to_file: bool = True, output_filename: str = 'processed_vm_data.csv') -> pd.DataFrame:
     """
     Preprocess VM instance data:
@@ -28,8 +60,6 @@ def preprocess_vm_data(df: pd.DataFrame, save_to_file: bool = True, output_filen
     # Convert timestamp to datetime
     df['timestamp'] = pd.to_datetime(df['timestamp'], format='%d-%m-%Y %H:%M')
     df['date'] = df['timestamp'].dt.date
-    df['hour'] = df['timestamp'].dt.hour
-    df['day_of_week'] = df['timestamp'].dt.dayofweek
     
     # Handle memory_used_bytes scientific notation
     df['memory_used_gb'] = df['memory_used_bytes'] / (1024**3)  # Convert to GB
@@ -39,55 +69,83 @@ def preprocess_vm_data(df: pd.DataFrame, save_to_file: bool = True, output_filen
     df['network_total_bytes'] = df['ingress_bytes'] + df['egress_bytes']
     df['disk_total_bytes'] = df['disk_read_bytes'] + df['disk_write_bytes']
     
-    # Extract instance ID from resource_global_name
-    df['instance_id'] = df['resource_global_name'].str.extract(r'/instances/(\d+)')
-    
-    # Extract zone from resource_global_name
-    df['zone'] = df['resource_global_name'].str.extract(r'/zones/([^/]+)/')
+    # Extract project, zone and instance ID from resource_global_name in a single pass
+    df[RESOURCE_NAME_FIELDS] = pd.DataFrame(
+        map(parse_resource_name, df['resource_global_name']),
+        index=df.index,
+        columns=RESOURCE_NAME_FIELDS
+    )
     
-    # Extract project from resource_global_name
-    df['project_id'] = df['resource_global_name'].str.extract(r'/projects/([^/]+)/')
+    # Categorize SKU types (vectorized equivalent of categorize_sku)
+    sku_lower = df['sku_description'].str.lower()
+    is_storage = (sku_lower.str.contains('vm state', regex=False, na=False)
+                  | sku_lower.str.contains('ssd', regex=False, na=False))
+    is_network = sku_lower.str.contains('network', regex=False, na=False)
+    df['sku_category'] = np.select(
+        [
+            is_storage,
+            is_network & sku_lower.str.contains('inter zone', regex=False, na=False),
+            is_network & sku_lower.str.contains('intra zone', regex=False, na=False),
+            is_network & sku_lower.str.contains('google services', regex=False, na=False),
+            is_network,
+        ],
+        ['Storage', 'Network_InterZone', 'Network_IntraZone', 'Network_GoogleServices', 'Network_Other'],
+        default='Other'
+    )
     
-    # Categorize SKU types
-    df['sku_category'] = df['sku_description'].apply(categorize_sku)
+    # Low-cardinality keys as categoricals so grouping hashes small integer codes
+    for col in ('instance_id', 'project_id', 'zone', 'sku_category'):
+        df[col] = df[col].astype('category')
     
     # Group and aggregate by date AND instance_id to keep instances separate
-    daily = df.groupby(['date', 'instance_id', 'project_id', 'zone'], dropna=False).agg({
-        'cpu_utilization': ['mean', 'std', 'min', 'max'],
-        'memory_used_gb': ['mean', 'std', 'min', 'max'],
-        'disk_read_bytes': ['sum', 'mean'],
-        'disk_write_bytes': ['sum', 'mean'],
-        'ingress_bytes': ['sum', 'mean'],
-        'egress_bytes': ['sum', 'mean'],
-        'network_total_bytes': ['sum', 'mean'],
-        'disk_total_bytes': ['sum', 'mean'],
-        'uptime_fraction': ['mean', 'min', 'max'],
-        'cost_usd': ['sum', 'mean', 'max'],
-        'cost_per_cpu': 'mean',
-        'sku_category': lambda x: x.mode()[0] if len(x.mode()) > 0 else x.iloc[0]  # Most common SKU category
-    }).reset_index()
+    exprs = [
+        getattr(pl.col(col), agg)().alias(f'{col}_{agg}')
+        for col, aggs in AGG_SPEC.items()
+        for agg in aggs
+    ]
+    # Most common SKU category (ties resolve to the first in sort order, as pandas' mode does).
+    # Column name kept as 'sku_category_<lambda>' to match existing processed files.
+    exprs.append(pl.col('sku_category').cast(pl.String).drop_nulls().mode().sort().first().alias('sku_category_<lambda>'))
     
-    # Flatten column names
-    daily.columns = ['_'.join(col).strip('_') if col[1] else col[0] for col in daily.columns.values]
-    
-    # Convert date column to string for JSON serialization
-    daily['date'] = daily['date'].astype(str)
-    
-    # Sort by date and instance_id for better readability
-    daily = daily.sort_values(['date', 'instance_id']).reset_index(drop=True)
+    # Only the keys and aggregated columns are handed to Polars
+    lf = pl.from_pandas(df[GROUP_KEYS + list(AGG_SPEC) + ['sku_category']]).lazy()
+    daily_pl = (
+        lf.group_by(GROUP_KEYS)
+        .agg(exprs)
+        .with_columns(pl.col('instance_id', 'project_id', 'zone').cast(pl.String))
+        # Rows are written in date order; train_test_split_vm_data relies on this to skip re-sorting
+        .sort(GROUP_KEYS, nulls_last=True)
+        # Convert date column to string for JSON serialization
+        .with_columns(pl.col('date').cast(pl.String))
+        .collect(engine='streaming')
+    )
     
     # Save to processed folder if requested
     if save_to_file:
         output_dir = os.path.join(os.path.dirname(__file__), '..', 'data', 'processed')
         os.makedirs(output_dir, exist_ok=True)  # Ensure directory exists
         output_path = os.path.join(output_dir, output_filename)
-        daily.to_csv(output_path, index=False)
+        # Ratio metrics fit comfortably in float32 on disk; the returned frame stays float64
+        narrow = [c for c in daily_pl.columns if c.startswith(FLOAT32_COLUMN_PREFIXES)]
+        daily_pl.with_columns(pl.col(narrow).cast(pl.Float32)).write_csv(output_path)
         print(f"Processed data saved to: {output_path}")
     
+    daily = daily_pl.to_pandas()
+    
     return daily
 
+def parse_resource_name(resource_global_name: str) -> tuple:
+    """Return (project_id, zone, instance_id) from a resource_global_name; fields that can't be found are None"""
+    if not isinstance(resource_global_name, str):
+        return (None, None, None)
+    match = RESOURCE_NAME_PATTERN.search(resource_global_name)
+    if match:
+        return match.groups()
+    matches = [pattern.search(resource_global_name) for pattern in RESOURCE_FIELD_PATTERNS]
+    return tuple(m.group(1) if m else None for m in matches)
+
 def categorize_sku(sku_description: str) -> str:
-    """Categorize SKU descriptions into broad categories"""
+    """Categorize a single SKU description into a broad category (scalar counterpart of the vectorized path in preprocess_vm_data)"""
     sku_lower = sku_description.lower()
     if 'vm state' in sku_lower or 'ssd' in sku_lower:
         return 'Storage'
@@ -1,21 +1,61 @@
 # app.py
 import streamlit as st
-import requests
+import asyncio
+import httpx
 import streamlit.components.v1 as components
 import json
-from utilities import alertMockData
+from utilities import alertMockData, alertTemplates
 
 st.set_page_config(layout="wide")
 
 # ------- FETCH REAL DATA FROM BACKEND -------
 BACKEND_URL = "http://localhost:8000/vm/recommendations"
 
-try:
-    alerts = requests.get(BACKEND_URL).json()
+# Endpoints fetched concurrently on each refresh; add more here as the dashboard grows
+BACKEND_ENDPOINTS = {"alerts": BACKEND_URL}
+
+# The fetch runs on the rerun path, so fail fast on connect and cap the wait for the
+# LLM-backed /vm/recommendations response
+BACKEND_TIMEOUT = httpx.Timeout(30, connect=2)
+
+# Impact pill classes; unknown levels fall back to the Medium style
+SEV_CLASS = {"High": "bg-rose-400", "Medium": "bg-amber-300 text-black", "Low": "bg-green-500"}
+
+async def _fetch_all(endpoints):
+    # One client per refresh: asyncio.run() closes its loop, so a client can't outlive the call
+    async with httpx.AsyncClient(timeout=BACKEND_TIMEOUT) as client:
+        responses = await asyncio.gather(*(client.get(url) for url in endpoints.values()))
+    results = {name: r.raise_for_status().json() for name, r in zip(endpoints, responses)}
+    alerts = results["alerts"]
+    if not isinstance(alerts, list) or not all(isinstance(a, dict) and "impact_level" in a for a in alerts):
+        raise ValueError("Backend response is not a list of alerts")
+    return results
+
+def _index_by_severity(alerts):
+    by_sev = {"All": alerts}
+    for a in alerts:
+        by_sev.setdefault(a["impact_level"], []).append(a)
+    return by_sev
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_alerts(endpoints):
+    # Successful fetches are reused for 60s; failures raise and are not cached here
+    return _index_by_severity(asyncio.run(_fetch_all(endpoints))["alerts"])
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _load_alerts(endpoints):
+    # Caches (by_sev, ok) for 15s so a down or misbehaving backend is retried at most
+    # every 15s instead of on every widget interaction
+    try:
+        return _fetch_alerts(endpoints), True
+    except Exception:
+        return _index_by_severity(alertMockData.alerts), False
+
+alerts_by_severity, from_backend = _load_alerts(BACKEND_ENDPOINTS)
+if from_backend:
     st.warning("Alerts: Fetched from backend.")
-except:
+else:
     st.warning("Alerts: Using mock data.")
-    alerts = alertMockData.alerts
     
 
 # ------- SEARCH + FILTER -------
@@ -28,71 +68,20 @@ with col_filter:
     severity_filter = st.selectbox("Severity", ["All", "High", "Medium", "Low"])
 
 # ------- FILTER LOGIC -------
-filtered = []
-for a in alerts:
-    # if search.lower() in a["title"].lower() or search.lower() in a["vm_instance"].lower():
-    if severity_filter == "All" or a["impact_level"] == severity_filter:
-        filtered.append(a)
+# Search box is not wired to the severity index yet; only the severity filter applies
+filtered = alerts_by_severity.get(severity_filter, [])
 
 # ------- TAILWIND + HTML UI -------
-html = """
-<!DOCTYPE html>
-<html>
-<head>
-<script src="https://cdn.tailwindcss.com"></script>
-<script src="https://unpkg.com/lucide@latest"></script>
-
-<style>
-.row-hover:hover {
-    transform: translateY(-2px);
-    transition: 0.15s ease;
-    box-shadow: 0 4px 14px rgba(0,0,0,0.06);
-    cursor: pointer;
-}
-.drawer {
-    position: fixed;
-    top: 0;
-    right: -450px;
-    width: 420px;
-    height: 100vh;
-    background: white;
-    transition: right .35s ease;
-    z-index: 100;
-    padding: 24px;
-    overflow-y: auto;
-    border-left: 1px solid #eee;
-}
-.overlay {
-    position: fixed;
-    top:0;
-    left:0;
-    width:100%;
-    height:100%;
-    background: rgba(0,0,0,0.35);
-    display:none;
-}
-.drawer.open { right:0; }
-.overlay.active { display:block; }
-</style>
-
-</head>
-
-<body class="bg-[#f5f6f8] text-gray-800">
-
-<div class="mt-4">
-
-  <div class="grid grid-cols-7 font-semibold text-gray-600 text-sm border-b pb-3">
-    <div class="col-span-3">Alert</div>
-    <div>Category</div>
-    <div>Impact</div>
-    <div>VM</div>
-  </div>
-"""
+parts = [alertTemplates.HTML_HEAD]
 
 # ------- ROWS -------
-for item in filtered:
-    html += f"""
-    <div onclick='openDrawer({json.dumps(item)})'
+# Serialize alerts once; rows reference them by index ("</" escaped so it can't close the script tag)
+alerts_json = json.dumps(filtered).replace("</", "<\\/")
+parts.append(f"<script>const ALERTS = {alerts_json};</script>")
+
+for i, item in enumerate(filtered):
+    parts.append(f"""
+    <div onclick='openDrawer({i})'
          class="grid grid-cols-7 py-5 border-b items-start bg-white rounded-lg row-hover">
 
         <div class="col-span-3">
@@ -110,7 +99,7 @@ for item in filtered:
 
         <div class="flex items-center">
             <span class="px-3 py-1 text-xs text-white rounded-full shadow
-                {'bg-rose-400' if item['impact_level']=='High' else 'bg-green-500' if item['impact_level']=='Low' else 'bg-amber-300 text-black'}">
+                {SEV_CLASS.get(item['impact_level'], SEV_CLASS['Medium'])}">
                 {item['impact_level']}
             </span>
         </div>
@@ -121,47 +110,9 @@ for item in filtered:
         </div>
 
     </div>
-    """
+    """)
 
 # ------- DRAWER -------
-html += """
-<div id="overlay" class="overlay"></div>
-
-<div id="drawer" class="drawer">
-    <h2 class="text-xl font-semibold flex items-center gap-2" id="drawer_title"></h2>
-    <p class="mt-2 text-gray-600" id="drawer_desc"></p>
-
-    <div class="mt-6">
-        <h3 class="font-semibold text-gray-800 text-md">Details</h3>
-        <p class="text-gray-700 mt-2 leading-relaxed" id="drawer_details"></p>
-    </div>
-
-    <button onclick="closeDrawer()"
-            class="mt-6 bg-gray-200 px-4 py-2 rounded-md text-sm shadow">
-        Close
-    </button>
-</div>
-
-<script>
-lucide.createIcons();
-
-function openDrawer(data) {
-    document.getElementById("drawer_title").innerText = data.title;
-    document.getElementById("drawer_desc").innerText = "VM: " + data.vm_instance;
-    document.getElementById("drawer_details").innerText = data.detailed_explanation;
-
-    document.getElementById("drawer").classList.add("open");
-    document.getElementById("overlay").classList.add("active");
-}
-
-function closeDrawer() {
-    document.getElementById("drawer").classList.remove("open");
-    document.getElementById("overlay").classList.remove("active");
-}
-</script>
-
-</body>
-</html>
-"""
+parts.append(alertTemplates.HTML_DRAWER)
 
-components.html(html, height=1100, scrolling=True)
+components.html("".join(parts), height=1100, scrolling=True)
@@ -1,4 +1,5 @@
-alerts = alerts = [
+# Immutable fallback alerts used by the dashboard when the backend is unreachable
+alerts = (
     {
         "title": "Short CPU and Disk Spike Detected",
         "vm_instance": "vm-app-01",
@@ -150,4 +151,4 @@ alerts = alerts = [
             "2. Consider using a regional load balancer to distribute traffic."
         ),
     },
-]
\ No newline at end of file
+)
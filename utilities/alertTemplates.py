@@ -0,0 +1,97 @@
+# Static HTML for the alerts dashboard. Kept in an imported module so the strings
+# are built once per process rather than on every Streamlit rerun of main.py.
+
+HTML_HEAD = """
+<!DOCTYPE html>
+<html>
+<head>
+<script src="https://cdn.tailwindcss.com"></script>
+<script src="https://unpkg.com/lucide@latest"></script>
+
+<style>
+.row-hover:hover {
+    transform: translateY(-2px);
+    transition: 0.15s ease;
+    box-shadow: 0 4px 14px rgba(0,0,0,0.06);
+    cursor: pointer;
+}
+.drawer {
+    position: fixed;
+    top: 0;
+    right: -450px;
+    width: 420px;
+    height: 100vh;
+    background: white;
+    transition: right .35s ease;
+    z-index: 100;
+    padding: 24px;
+    overflow-y: auto;
+    border-left: 1px solid #eee;
+}
+.overlay {
+    position: fixed;
+    top:0;
+    left:0;
+    width:100%;
+    height:100%;
+    background: rgba(0,0,0,0.35);
+    display:none;
+}
+.drawer.open { right:0; }
+.overlay.active { display:block; }
+</style>
+
+</head>
+
+<body class="bg-[#f5f6f8] text-gray-800">
+
+<div class="mt-4">
+
+  <div class="grid grid-cols-7 font-semibold text-gray-600 text-sm border-b pb-3">
+    <div class="col-span-3">Alert</div>
+    <div>Category</div>
+    <div>Impact</div>
+    <div>VM</div>
+  </div>
+"""
+
+HTML_DRAWER = """
+<div id="overlay" class="overlay"></div>
+
+<div id="drawer" class="drawer">
+    <h2 class="text-xl font-semibold flex items-center gap-2" id="drawer_title"></h2>
+    <p class="mt-2 text-gray-600" id="drawer_desc"></p>
+
+    <div class="mt-6">
+        <h3 class="font-semibold text-gray-800 text-md">Details</h3>
+        <p class="text-gray-700 mt-2 leading-relaxed" id="drawer_details"></p>
+    </div>
+
+    <button onclick="closeDrawer()"
+            class="mt-6 bg-gray-200 px-4 py-2 rounded-md text-sm shadow">
+        Close
+    </button>
+</div>
+
+<script>
+lucide.createIcons();
+
+function openDrawer(idx) {
+    const data = ALERTS[idx];
+    document.getElementById("drawer_title").innerText = data.title;
+    document.getElementById("drawer_desc").innerText = "VM: " + data.vm_instance;
+    document.getElementById("drawer_details").innerText = data.detailed_explanation;
+
+    document.getElementById("drawer").classList.add("open");
+    document.getElementById("overlay").classList.add("active");
+}
+
+function closeDrawer() {
+    document.getElementById("drawer").classList.remove("open");
+    document.getElementById("overlay").classList.remove("active");
+}
+</script>
+
+</body>
+</html>
+"""